@@ -17,9 +17,10 @@
 # under the License.
 
 import re
+import string
 import warnings
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, reduce
 from itertools import filterfalse, tee
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, TypeVar
 from urllib import parse
@@ -36,7 +37,9 @@ if TYPE_CHECKING:
 
 KEY_REGEX = re.compile(r'^[\w.-]+$')
 GROUP_KEY_REGEX = re.compile(r'^[\w-]+$')
-CAMELCASE_TO_SNAKE_CASE_REGEX = re.compile(r'(?!^)([A-Z]+)')
+# ASCII subsets of the regexes above, used to accept the common case without the regex engine
+KEY_CHARS = frozenset(string.ascii_letters + string.digits + '_.-')
+GROUP_KEY_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
 
 T = TypeVar('T')
 S = TypeVar('S')
@@ -48,6 +51,8 @@ def validate_key(k: str, max_length: int = 250):
         raise TypeError(f"The key has to be a string and is {type(k)}:{k}")
     if len(k) > max_length:
         raise AirflowException(f"The key has to be less than {max_length} characters")
+    if k and KEY_CHARS.issuperset(k):
+        return
     if not KEY_REGEX.match(k):
         raise AirflowException(
             "The key ({k}) has to be made of alphanumeric characters, dashes, "
@@ -61,6 +66,8 @@ def validate_group_key(k: str, max_length: int = 200):
         raise TypeError(f"The key has to be a string and is {type(k)}:{k}")
     if len(k) > max_length:
         raise AirflowException(f"The key has to be less than {max_length} characters")
+    if k and GROUP_KEY_CHARS.issuperset(k):
+        return
     if not GROUP_KEY_REGEX.match(k):
         raise AirflowException(
             f"The key ({k}) has to be made of alphanumeric characters, dashes " "and underscores exclusively"
@@ -107,18 +114,19 @@ def as_tuple(obj: Any) -> tuple:
     If obj is a container, returns obj as a tuple.
     Otherwise, returns a tuple containing obj.
     """
+    if type(obj) is tuple:
+        return obj
     if is_container(obj):
         return tuple(obj)
     else:
-        return tuple([obj])
+        return (obj,)
 
 
 def chunks(items: List[T], chunk_size: int) -> Generator[List[T], None, None]:
     """Yield successive chunks of a given size from a list of items"""
     if chunk_size <= 0:
         raise ValueError('Chunk size must be a positive integer')
-    for i in range(0, len(items), chunk_size):
-        yield items[i : i + chunk_size]
+    return (items[i : i + chunk_size] for i in range(0, len(items), chunk_size))
 
 
 def reduce_in_chunks(fn: Callable[[S, List[T]], S], iterable: List[T], initializer: S, chunk_size: int = 0):
@@ -143,8 +151,10 @@ def as_flattened_list(iterable: Iterable[Iterable[T]]) -> List[T]:
     return [e for i in iterable for e in i]
 
 
+# Sharing cached Templates between handlers is safe: jinja2 Template.render does not mutate the template
+@lru_cache(maxsize=256)
 def parse_template_string(template_string):
-    """Parses Jinja template string."""
+    """Parses Jinja template string (cached per template string)."""
     if "{{" in template_string:  # jinja mode
         return None, Template(template_string)
     else:
@@ -177,7 +187,17 @@ def render_log_filename(ti: "TaskInstance", try_number, filename_template) -> st
 
 def convert_camel_to_snake(camel_str: str) -> str:
     """Converts CamelCase to snake_case."""
-    return CAMELCASE_TO_SNAKE_CASE_REGEX.sub(r'_\1', camel_str).lower()
+    # An underscore is inserted before every uppercase run, never at index 0,
+    # e.g. ``HTTPSensor`` -> ``h_ttpsensor``.
+    chars = []
+    prev_upper = False
+    for i, char in enumerate(camel_str):
+        is_upper = 'A' <= char <= 'Z'
+        if is_upper and i > 0 and (i == 1 or not prev_upper):
+            chars.append('_')
+        chars.append(char)
+        prev_upper = is_upper
+    return ''.join(chars).lower()
 
 
 def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
@@ -187,11 +207,17 @@ def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
     Lists are not concatenated. Items in dict2 overwrite those also found in dict1.
     """
     merged = dict1.copy()
-    for k, v in dict2.items():
-        if k in merged and isinstance(v, dict):
-            merged[k] = merge_dicts(merged.get(k, {}), v)
-        else:
-            merged[k] = v
+    stack = [(merged, dict2)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            current = target.get(k)
+            if isinstance(current, dict) and isinstance(v, dict):
+                current = current.copy()
+                target[k] = current
+                stack.append((current, v))
+            else:
+                target[k] = v
     return merged
 
 